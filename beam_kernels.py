@@ -0,0 +1,92 @@
+# beam_kernels.py
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # numba is optional; without it the kernels below run as plain Python/NumPy code
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def tip_deflections(length, width, thickness, E, w, P, a, is_point):
+        """
+        Tip deflection magnitude [m] of a single-material cantilever for every
+        (beam, material, load) combination, returned as an array of shape
+        (n_beams, n_materials, n_loads).
+        Distributed loads use w*L^4/(8*E*I); point loads use P*a^2*(3L - a)/(6*E*I)
+        and give NaN when the load position a is not on the beam (0 < a <= L).
+        A NaN w (how BeamLibrary marks loads of unknown type) also gives NaN.
+        """
+        n_beams = length.size
+        n_materials = E.size
+        n_loads = w.size
+        out = np.empty((n_beams, n_materials, n_loads))
+        for i in range(n_beams):
+            L = length[i]
+            I = (width[i] * thickness[i] ** 3) / 12.0
+            for j in range(n_materials):
+                EI = E[j] * I
+                for k in range(n_loads):
+                    if is_point[k]:
+                        ak = a[k]
+                        if 0.0 < ak <= L:
+                            out[i, j, k] = P[k] * ak * ak * (3.0 * L - ak) / (6.0 * EI)
+                        else:
+                            out[i, j, k] = np.nan
+                    else:
+                        out[i, j, k] = w[k] * L ** 4 / (8.0 * EI)
+        return out
+else:
+    def tip_deflections(length, width, thickness, E, w, P, a, is_point):
+        """
+        Tip deflection magnitude [m] of a single-material cantilever for every
+        (beam, material, load) combination, returned as an array of shape
+        (n_beams, n_materials, n_loads).
+        Distributed loads use w*L^4/(8*E*I); point loads use P*a^2*(3L - a)/(6*E*I)
+        and give NaN when the load position a is not on the beam (0 < a <= L).
+        A NaN w (how BeamLibrary marks loads of unknown type) also gives NaN.
+        NumPy version used when numba is not installed, broadcast over all three axes.
+        """
+        L = length[:, None, None]
+        EI = E[None, :, None] * ((width * thickness ** 3) / 12.0)[:, None, None]
+        on_beam = (0.0 < a) & (a <= L)
+        point = np.where(on_beam, P * a * a * (3.0 * L - a) / (6.0 * EI), np.nan)
+        distributed = w * L ** 4 / (8.0 * EI)
+        return np.where(is_point, point, distributed)
+
+
+if NUMBA_AVAILABLE:
+    # Serial on purpose: a block is only a few thousand samples, and this already runs
+    # inside every ProcessPoolExecutor worker, so a numba thread pool would only add overhead
+    @njit(fastmath=True, cache=True)
+    def combine_block(y_E1, y_E2, theta_E1, theta_E2, inv_E1, inv_E2, y, theta):
+        """
+        Fill y and theta for one pair of materials from the material-independent
+        parts of the distributed load solution, given the reciprocals 1/E1 and 1/E2:
+            y = y_E1 * inv_E1 + y_E2 * inv_E2,  theta = theta_E1 * inv_E1 + theta_E2 * inv_E2
+        Done in one fused multiply-add pass over x, without temporary arrays.
+        """
+        for i in range(y.size):
+            y[i] = y_E1[i] * inv_E1 + y_E2[i] * inv_E2
+            theta[i] = theta_E1[i] * inv_E1 + theta_E2[i] * inv_E2
+else:
+    def combine_block(y_E1, y_E2, theta_E1, theta_E2, inv_E1, inv_E2, y, theta):
+        """
+        Fill y and theta for one pair of materials from the material-independent
+        parts of the distributed load solution, given the reciprocals 1/E1 and 1/E2:
+            y = y_E1 * inv_E1 + y_E2 * inv_E2,  theta = theta_E1 * inv_E1 + theta_E2 * inv_E2
+        NumPy version used when numba is not installed.
+        """
+        np.multiply(y_E1, inv_E1, out=y)
+        y += y_E2 * inv_E2
+        np.multiply(theta_E1, inv_E1, out=theta)
+        theta += theta_E2 * inv_E2
@@ -2,96 +2,223 @@
 
 import json
 import os
-from dataclasses import dataclass, asdict
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 
-@dataclass
+from beam_kernels import tip_deflections
+
+try:
+    import orjson  # Optional: much faster JSON parsing and serialization
+except ImportError:
+    orjson = None
+
+
+@dataclass(slots=True)
 class Material:
     name: str
     E: float  # Modulus of Elasticity in Pascals
+    _key: str = field(init=False, repr=False, compare=False)  # Lower-cased name used for lookups
+
+    def __post_init__(self):
+        self._key = self.name.lower()
+
+    def to_dict(self) -> dict:
+        """Return the material as a plain dict for serialization."""
+        return {"name": self.name, "E": self.E}
 
 
-@dataclass
+@dataclass(slots=True)
 class Beam:
     name: str
     length: float  # Length of the beam in meters
     width: float  # Width of the beam in meters
     thickness: float  # Thickness of the beam in meters
+    _key: str = field(init=False, repr=False, compare=False)  # Lower-cased name used for lookups
+    _I: Optional[float] = field(default=None, init=False, repr=False, compare=False)  # Cached moment of inertia
+
+    def __post_init__(self):
+        self._key = self.name.lower()
 
     def moment_of_inertia(self) -> float:
         """Calculate the Moment of Inertia for a rectangular cross-section."""
-        return (self.width * self.thickness ** 3) / 12
+        I = self._I
+        if I is None:
+            I = (self.width * self.thickness ** 3) / 12
+            self._I = I
+        return I
+
+    def to_dict(self) -> dict:
+        """Return the beam as a plain dict for serialization."""
+        return {"name": self.name, "length": self.length, "width": self.width, "thickness": self.thickness}
 
 
-@dataclass
+@dataclass(slots=True)
 class Load:
     name: str
     load_type: str = "distributed"  # 'distributed' or 'point', default to 'distributed'
     w: Optional[float] = None  # Distributed load in N/m
     P: Optional[float] = None  # Point load in N
     a: Optional[float] = None  # Position along the beam in meters
+    _key: str = field(init=False, repr=False, compare=False)  # Lower-cased name used for lookups
+
+    def __post_init__(self):
+        self._key = self.name.lower()
+
+    def to_dict(self) -> dict:
+        """Return the load as a plain dict for serialization."""
+        return {"name": self.name, "load_type": self.load_type, "w": self.w, "P": self.P, "a": self.a}
 
 
 class BeamLibrary:
     def __init__(self, filepath: str = "library_data.json"):
         self.filepath = filepath
-        self.materials: List[Material] = []
-        self.beams: List[Beam] = []
-        self.loads: List[Load] = []
-        self.load_library()
+        # The library file is only read on first access (see _ensure_loaded)
+        self._loaded = False
+        self._materials: List[Material] = []
+        self._beams: List[Beam] = []
+        self._loads: List[Load] = []
+        # Lookup indexes keyed by lower-cased name, kept in sync with the lists above
+        self._mat_idx: Dict[str, Material] = {}
+        self._beam_idx: Dict[str, Beam] = {}
+        self._load_idx: Dict[str, Load] = {}
+        # Structure-of-arrays copies of the numeric fields for vectorized analysis.
+        # Rebuilt lazily from the lists above whenever an entry changes.
+        self._arrays_dirty = True
+        self._beam_arrays: Tuple[np.ndarray, ...] = ()
+        self._material_E = np.empty(0)
+        self._load_arrays: Tuple[np.ndarray, ...] = ()
+
+    @property
+    def materials(self) -> List[Material]:
+        self._ensure_loaded()
+        return self._materials
+
+    @property
+    def beams(self) -> List[Beam]:
+        self._ensure_loaded()
+        return self._beams
+
+    @property
+    def loads(self) -> List[Load]:
+        self._ensure_loaded()
+        return self._loads
+
+    def _ensure_loaded(self):
+        """Load the library file the first time any library data is needed."""
+        if not self._loaded:
+            self.load_library()
 
     def load_library(self):
         """Load library data from a JSON file."""
+        # _loaded is only set once the data is in place, so a file that fails to parse
+        # raises again on the next access instead of looking like an empty library
         if not os.path.exists(self.filepath):
-            self.initialize_default_library()
+            self._materials, self._beams, self._loads = [], [], []
+            self._initialize_default_library()
+            self._rebuild_indexes()
+            self._arrays_dirty = True
+            self._loaded = True
             self.save_library()
         else:
-            with open(self.filepath, 'r') as file:
-                data = json.load(file)
-                self.materials = [Material(**mat) for mat in data.get("materials", [])]
-                self.beams = [Beam(**beam) for beam in data.get("beams", [])]
-
-                # Handle missing 'load_type' by defaulting to 'distributed'
-                loads_data = data.get("loads", [])
-                for load in loads_data:
-                    if 'load_type' not in load:
-                        load['load_type'] = 'distributed'
-                    # Ensure relevant fields are present based on 'load_type'
-                    if load['load_type'] == 'distributed' and 'w' not in load:
-                        load['w'] = 0.0
-                    elif load['load_type'] == 'point':
-                        load.setdefault('P', 0.0)
-                        load.setdefault('a', 0.0)
-                self.loads = [Load(**load) for load in loads_data]
+            with open(self.filepath, 'rb') as file:
+                if orjson is not None:
+                    data = orjson.loads(file.read())
+                else:
+                    data = json.load(file)
+                materials = [Material(**mat) for mat in data.get("materials", [])]
+                beams = [Beam(**beam) for beam in data.get("beams", [])]
+
+                # Build loads in a single pass, defaulting missing 'load_type' to 'distributed'
+                # and filling in the fields relevant to each load type
+                loads = []
+                for ld in data.get("loads", []):
+                    load_type = ld.get("load_type", "distributed")
+                    if load_type == "distributed":
+                        loads.append(Load(name=ld["name"], load_type=load_type, w=ld.get("w", 0.0)))
+                    elif load_type == "point":
+                        loads.append(Load(name=ld["name"], load_type=load_type,
+                                          P=ld.get("P", 0.0), a=ld.get("a", 0.0)))
+                    else:
+                        loads.append(Load(name=ld["name"], load_type=load_type,
+                                          w=ld.get("w"), P=ld.get("P"), a=ld.get("a")))
+            self._materials, self._beams, self._loads = materials, beams, loads
+            self._rebuild_indexes()
+            self._arrays_dirty = True
+            self._loaded = True
+
+    def _rebuild_indexes(self):
+        """Rebuild the name lookup indexes from the current lists."""
+        self._mat_idx = {mat._key: mat for mat in self._materials}
+        self._beam_idx = {beam._key: beam for beam in self._beams}
+        self._load_idx = {load._key: load for load in self._loads}
+
+    def _rebuild_arrays(self):
+        """Rebuild the numeric arrays from the current lists if anything has changed."""
+        self._ensure_loaded()
+        if not self._arrays_dirty:
+            return
+
+        def column(items, getter):
+            arr = np.fromiter((getter(item) for item in items), dtype=float, count=len(items))
+            arr.setflags(write=False)
+            return arr
+
+        self._beam_arrays = (
+            column(self.beams, lambda b: b.length),
+            column(self.beams, lambda b: b.width),
+            column(self.beams, lambda b: b.thickness),
+        )
+        self._material_E = column(self.materials, lambda m: m.E)
+
+        # Distributed loads only carry w, point loads only carry P and a; the unused fields are 0.
+        # Loads of any other type get w = NaN so their tip deflections come out as NaN.
+        is_point = np.fromiter((ld.load_type == "point" for ld in self.loads), dtype=bool, count=len(self.loads))
+        is_point.setflags(write=False)
+        self._load_arrays = (
+            column(self.loads, lambda ld: (ld.w or 0.0) if ld.load_type == "distributed"
+                   else 0.0 if ld.load_type == "point" else np.nan),
+            column(self.loads, lambda ld: (ld.P or 0.0) if ld.load_type == "point" else 0.0),
+            column(self.loads, lambda ld: (ld.a or 0.0) if ld.load_type == "point" else 0.0),
+            is_point,
+        )
+        self._arrays_dirty = False
 
     def save_library(self):
         """Save library data to a JSON file."""
         data = {
-            "materials": [asdict(mat) for mat in self.materials],
-            "beams": [asdict(beam) for beam in self.beams],
-            "loads": [asdict(load) for load in self.loads]
+            "materials": [mat.to_dict() for mat in self.materials],
+            "beams": [beam.to_dict() for beam in self.beams],
+            "loads": [load.to_dict() for load in self.loads]
         }
-        with open(self.filepath, 'w') as file:
-            json.dump(data, file, indent=4)
+        if orjson is not None:
+            with open(self.filepath, 'wb') as file:
+                file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(self.filepath, 'w') as file:
+                json.dump(data, file, indent=2)
         print(f"Library data saved to '{self.filepath}'.")
 
-    def initialize_default_library(self):
-        """Initialize the library with default materials, beams, and loads."""
+    def _initialize_default_library(self):
+        """
+        Fill the empty lists with default materials, beams, and loads.
+        Only for use by load_library, which rebuilds the indexes afterwards.
+        """
         # Define default Materials
         default_materials = [
             Material(name="Steel", E=200e9),
             Material(name="Aluminum", E=69e9),
             Material(name="Titanium", E=116e9)
         ]
-        self.materials.extend(default_materials)
+        self._materials.extend(default_materials)
 
         # Define default Beams
         default_beams = [
             Beam(name="Beam1", length=10.0, width=0.3, thickness=0.005),
             Beam(name="Beam2", length=8.0, width=0.25, thickness=0.004)
         ]
-        self.beams.extend(default_beams)
+        self._beams.extend(default_beams)
 
         # Define default Loads
         default_loads = [
@@ -99,61 +226,114 @@ class BeamLibrary:
             Load(name="Heavy Uniform Load", load_type="distributed", w=2000.0),  # 2000 N/m
             Load(name="Point Load 1", load_type="point", P=5000.0, a=5.0)  # 5000 N at 5 m
         ]
-        self.loads.extend(default_loads)
+        self._loads.extend(default_loads)
 
     def add_material(self, material: Material):
         """Add a new material to the library."""
-        if any(mat.name.lower() == material.name.lower() for mat in self.materials):
+        self._ensure_loaded()
+        key = material._key
+        if key in self._mat_idx:
             print(f"Material '{material.name}' already exists.")
             return
         self.materials.append(material)
+        self._mat_idx[key] = material
+        self._arrays_dirty = True
         print(f"Material '{material.name}' added.")
 
     def add_beam(self, beam: Beam):
         """Add a new beam to the library."""
-        if any(b.name.lower() == beam.name.lower() for b in self.beams):
+        self._ensure_loaded()
+        key = beam._key
+        if key in self._beam_idx:
             print(f"Beam '{beam.name}' already exists.")
             return
         self.beams.append(beam)
+        self._beam_idx[key] = beam
+        self._arrays_dirty = True
         print(f"Beam '{beam.name}' added.")
 
     def add_load(self, load: Load):
         """Add a new load to the library."""
-        if any(ld.name.lower() == load.name.lower() for ld in self.loads):
+        self._ensure_loaded()
+        key = load._key
+        if key in self._load_idx:
             print(f"Load '{load.name}' already exists.")
             return
         self.loads.append(load)
+        self._load_idx[key] = load
+        self._arrays_dirty = True
         print(f"Load '{load.name}' added.")
 
     def remove_material(self, material_name: str):
         """Remove a material from the library."""
-        material = next((mat for mat in self.materials if mat.name.lower() == material_name.lower()), None)
+        self._ensure_loaded()
+        material = self._mat_idx.pop(material_name.lower(), None)
         if not material:
             print(f"Material '{material_name}' not found.")
             return
         # Optional: Check if any beam or load is using this material
         # For now, assume materials are independent
         self.materials.remove(material)
+        self._arrays_dirty = True
         print(f"Material '{material_name}' removed.")
 
     def remove_beam(self, beam_name: str):
         """Remove a beam from the library."""
-        beam = next((b for b in self.beams if b.name.lower() == beam_name.lower()), None)
+        self._ensure_loaded()
+        beam = self._beam_idx.pop(beam_name.lower(), None)
         if not beam:
             print(f"Beam '{beam_name}' not found.")
             return
         self.beams.remove(beam)
+        self._arrays_dirty = True
         print(f"Beam '{beam_name}' removed.")
 
     def remove_load(self, load_name: str):
         """Remove a load from the library."""
-        load = next((ld for ld in self.loads if ld.name.lower() == load_name.lower()), None)
+        self._ensure_loaded()
+        load = self._load_idx.pop(load_name.lower(), None)
         if not load:
             print(f"Load '{load_name}' not found.")
             return
         self.loads.remove(load)
+        self._arrays_dirty = True
         print(f"Load '{load_name}' removed.")
 
+    def import_jsonl(self, path: str):
+        """
+        Bulk import materials, beams, and loads from a JSON Lines file.
+        Each line is one object whose "kind" field ('material', 'beam' or 'load')
+        selects the entry type; the remaining fields are that entry's fields.
+        Entries get the same checks as the interactive prompts, and loads get the
+        same defaults as load_library. Bad lines are reported and skipped.
+        """
+        entry_types = {"material": (_material_from_record, self.add_material),
+                       "beam": (_beam_from_record, self.add_beam),
+                       "load": (_load_from_record, self.add_load)}
+        with open(path, 'rb') as file:
+            for line_number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record = orjson.loads(line) if orjson is not None else json.loads(line)
+                except ValueError as e:
+                    print(f"Line {line_number}: invalid JSON ({e}). Skipping.")
+                    continue
+                if not isinstance(record, dict):
+                    print(f"Line {line_number}: expected a JSON object. Skipping.")
+                    continue
+                kind = record.pop("kind", None)
+                if kind not in entry_types:
+                    print(f"Line {line_number}: unknown kind '{kind}'. Skipping.")
+                    continue
+                build, add = entry_types[kind]
+                try:
+                    entry = build(record)
+                except ValueError as e:
+                    print(f"Line {line_number}: invalid {kind} ({e}). Skipping.")
+                    continue
+                add(entry)
+
     def get_materials(self) -> List[Material]:
         return self.materials
 
@@ -163,10 +343,31 @@ class BeamLibrary:
     def get_loads(self) -> List[Load]:
         return self.loads
 
+    def get_beam(self, beam_name: str) -> Optional[Beam]:
+        """Look up a beam by name (case-insensitive)."""
+        self._ensure_loaded()
+        return self._beam_idx.get(beam_name.lower())
+
+    def get_beam_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return (length, width, thickness) arrays, in the same order as get_beams()."""
+        self._rebuild_arrays()
+        return self._beam_arrays
+
+    def get_material_moduli(self) -> np.ndarray:
+        """Return the Modulus of Elasticity array, in the same order as get_materials()."""
+        self._rebuild_arrays()
+        return self._material_E
+
+    def get_load_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Return (w, P, a, is_point) arrays, in the same order as get_loads()."""
+        self._rebuild_arrays()
+        return self._load_arrays
+
     def modify_beam_dimensions(self, beam_name: str, new_length: Optional[float] = None,
                                new_width: Optional[float] = None, new_thickness: Optional[float] = None):
         """Modify the dimensions of an existing beam."""
-        beam = next((b for b in self.beams if b.name.lower() == beam_name.lower()), None)
+        self._ensure_loaded()
+        beam = self._beam_idx.get(beam_name.lower())
         if not beam:
             print(f"Beam '{beam_name}' not found.")
             return
@@ -175,10 +376,27 @@ class BeamLibrary:
             print(f"Beam '{beam_name}' length updated to {new_length} m.")
         if new_width is not None:
             beam.width = new_width
+            beam._I = None
             print(f"Beam '{beam_name}' width updated to {new_width} m.")
         if new_thickness is not None:
             beam.thickness = new_thickness
+            beam._I = None
             print(f"Beam '{beam_name}' thickness updated to {new_thickness} m.")
+        self._arrays_dirty = True
+
+    def moments_of_inertia(self) -> np.ndarray:
+        """Calculate the Moment of Inertia of every beam at once, in the same order as the beam list."""
+        _, width, thickness = self.get_beam_arrays()
+        return (width * thickness ** 3) / 12.0
+
+    def analyze_all(self) -> np.ndarray:
+        """
+        Tip deflection [m] of every beam under every load for each single material.
+        Returns an array of shape (beams, materials, loads), in library order.
+        """
+        length, width, thickness = self.get_beam_arrays()
+        w, P, a, is_point = self.get_load_arrays()
+        return tip_deflections(length, width, thickness, self.get_material_moduli(), w, P, a, is_point)
 
     def view_library(self):
         """Display current materials, beams, and loads."""
@@ -193,9 +411,9 @@ class BeamLibrary:
         if not self.beams:
             print("No beams available.")
         else:
-            for beam in self.beams:
+            for beam, I in zip(self.beams, self.moments_of_inertia()):
                 print(
-                    f"Name: {beam.name}, Length: {beam.length} m, Width: {beam.width} m, Thickness: {beam.thickness} m, I: {beam.moment_of_inertia():.6e} m^4")
+                    f"Name: {beam.name}, Length: {beam.length} m, Width: {beam.width} m, Thickness: {beam.thickness} m, I: {I:.6e} m^4")
 
         print("\n--- Loads ---")
         if not self.loads:
@@ -211,6 +429,64 @@ class BeamLibrary:
         print()
 
 
+def _record_name(record: dict, fields: Tuple[str, ...]) -> str:
+    """Check an imported record only has the given fields and return its name."""
+    unexpected = sorted(set(record) - set(fields))
+    if unexpected:
+        raise ValueError(f"unexpected field(s) {', '.join(unexpected)}")
+    name = record.get("name")
+    if not isinstance(name, str) or not name.strip():
+        raise ValueError("name must be a non-empty string")
+    return name.strip()
+
+
+def _record_number(record: dict, key: str, default: Optional[float] = None, allow_zero: bool = False) -> float:
+    """
+    Return record[key] as a float, checked the same way as the interactive prompts:
+    positive, or non-negative with allow_zero. A missing field takes the default
+    unchecked, or is an error if there is no default.
+    """
+    if record.get(key) is None:
+        if default is None:
+            raise ValueError(f"missing '{key}'")
+        return default
+    # float() would turn JSON true/false into 1.0/0.0
+    if isinstance(record[key], bool):
+        raise ValueError(f"'{key}' must be a number")
+    try:
+        value = float(record[key])
+    except (TypeError, ValueError):
+        raise ValueError(f"'{key}' must be a number") from None
+    if allow_zero and value < 0:
+        raise ValueError(f"'{key}' cannot be negative")
+    if not allow_zero and value <= 0:
+        raise ValueError(f"'{key}' must be positive")
+    return value
+
+
+def _material_from_record(record: dict) -> Material:
+    name = _record_name(record, ("name", "E"))
+    return Material(name=name, E=_record_number(record, "E"))
+
+
+def _beam_from_record(record: dict) -> Beam:
+    name = _record_name(record, ("name", "length", "width", "thickness"))
+    return Beam(name=name, length=_record_number(record, "length"), width=_record_number(record, "width"),
+                thickness=_record_number(record, "thickness"))
+
+
+def _load_from_record(record: dict) -> Load:
+    name = _record_name(record, ("name", "load_type", "w", "P", "a"))
+    # Same defaults as load_library: missing type is distributed, missing values are 0
+    load_type = record.get("load_type") or "distributed"
+    if load_type == "distributed":
+        return Load(name=name, load_type=load_type, w=_record_number(record, "w", 0.0))
+    if load_type == "point":
+        return Load(name=name, load_type=load_type, P=_record_number(record, "P", 0.0),
+                    a=_record_number(record, "a", 0.0, allow_zero=True))
+    raise ValueError(f"unknown load_type '{load_type}'")
+
+
 def add_new_material(library: BeamLibrary):
     print("\nAdd New Material")
     name = input("Enter material name: ").strip()
@@ -314,7 +590,7 @@ def modify_existing_beam(library: BeamLibrary):
     if not beam_name:
         print("Beam name cannot be empty.")
         return
-    beam = next((b for b in library.get_beams() if b.name.lower() == beam_name.lower()), None)
+    beam = library.get_beam(beam_name)
     if not beam:
         print(f"Beam '{beam_name}' not found.")
         return
@@ -409,6 +685,21 @@ def remove_element(library: BeamLibrary):
             print("Invalid option. Please select a number between 1 and 4.")
 
 
+def bulk_import(library: BeamLibrary):
+    print("\nBulk Import from File")
+    path = input("Enter path to a JSON Lines file: ").strip()
+    if not path:
+        print("File path cannot be empty.")
+        return
+    if not os.path.exists(path):
+        print(f"File '{path}' not found.")
+        return
+    try:
+        library.import_jsonl(path)
+    except OSError as e:
+        print(f"Could not read '{path}': {e}")
+
+
 def main():
     library = BeamLibrary()
 
@@ -422,7 +713,8 @@ def main():
         print("6. Remove Elements")
         print("7. Save and Exit")
         print("8. Exit without Saving")
-        choice = input("Select an option (1-8): ").strip()
+        print("9. Bulk Import from File")
+        choice = input("Select an option (1-9): ").strip()
 
         if choice == '1':
             library.view_library()
@@ -447,8 +739,10 @@ def main():
                 break
             else:
                 print("Exit canceled.")
+        elif choice == '9':
+            bulk_import(library)
         else:
-            print("Invalid option. Please select a number between 1 and 8.")
+            print("Invalid option. Please select a number between 1 and 9.")
 
 
 if __name__ == "__main__":
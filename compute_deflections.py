@@ -4,64 +4,223 @@ import numpy as np
 import matplotlib.pyplot as plt
 import csv
 import itertools
+import math
+import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
 from beam_library import BeamLibrary, Beam, Material, Load
+from beam_kernels import combine_block
 import matplotlib as mpl
 
+# Radians to degrees conversion factor
+_RAD2DEG = 180.0 / math.pi
+
+def _distributed_load_parts(x, I, L, T, w):
+    """
+    The Distributed Load equations split into their 1/E1 and 1/E2 parts:
+        y1 = y1_E1 / E1,  theta1 = theta1_E1 / E1                    (0 <= x < T)
+        y2 = y2_E1 / E1 + y2_E2 / E2,  theta2 = theta2_E1 / E1 + theta2_E2 / E2  (T <= x <= L)
+    Returns (y1_E1, theta1_E1, y2_E1, y2_E2, theta2_E1, theta2_E2). theta2_E1 does not depend on x.
+    x may be a scalar or a NumPy array.
+    """
+    # Powers by explicit multiplication rather than ** (which goes through np.power for arrays)
+    u = L - x
+    u2 = u * u
+    u3 = u2 * u
+    u4 = u2 * u2
+    L3 = L * L * L
+    L4 = L3 * L
+    LmT = L - T
+    LmT3 = LmT * LmT * LmT
+    LmT4 = LmT3 * LmT
+    c_w24I = w / (24 * I)
+    c_w6I = w / (6 * I)
+    # coefficient in y2/theta2 split into its 1/E1 and 1/E2 parts
+    coefficient_E1 = -c_w6I * (L3 - LmT3)
+    coefficient_E2 = -c_w6I * LmT3
+
+    y1_E1 = -c_w24I * u4 - c_w6I * L3 * x + c_w24I * L4
+    theta1_E1 = c_w6I * u3 - c_w6I * L3
+    y2_E1 = coefficient_E1 * (x - T) + c_w24I * (L4 - LmT4 - 4 * L3 * T)
+    y2_E2 = -c_w24I * u4 + coefficient_E2 * (x - T) + c_w24I * LmT4
+    theta2_E2 = c_w6I * u3 + coefficient_E2
+    return y1_E1, theta1_E1, y2_E1, y2_E2, coefficient_E1, theta2_E2
+
 def y1(x, E1, I, L, w):
     """
     Deflection equation y1(x) for 0 <= x < T (Distributed Load)
+    x may be a scalar or a NumPy array.
     """
-    return (-w / (24 * E1 * I)) * (L - x)**4 - (w * L**3) / (6 * E1 * I) * x + (w * L**4) / (24 * E1 * I)
+    # y1 does not depend on T, so any value will do
+    y1_E1 = _distributed_load_parts(x, I, L, L, w)[0]
+    return y1_E1 / E1
 
 def y2(x, E1, E2, I, L, T, w):
     """
     Deflection equation y2(x) for T <= x <= L (Distributed Load)
+    x may be a scalar or a NumPy array.
     """
-    term1 = (-w) / (24 * E2 * I) * (L - x)**4
-    coefficient = (-w) / (6 * I) * ((L**3 - (L - T)**3)/E1 + (L - T)**3 / E2)
-    term2 = coefficient * x
-    term3 = (w / (24 * E1 * I)) * (L**4 - (L - T)**4 - 4 * L**3 * T)
-    term4 = (w / (24 * E2 * I)) * (L - T)**4
-    term5 = -coefficient * T
-    return term1 + term2 + term3 + term4 + term5
+    _, _, y2_E1, y2_E2, _, _ = _distributed_load_parts(x, I, L, T, w)
+    return y2_E1 / E1 + y2_E2 / E2
 
 def theta1(x, E1, I, L, w):
     """
     Angular deflection theta1(x) for 0 <= x < T (Distributed Load)
+    x may be a scalar or a NumPy array.
     """
-    return (w / (6 * E1 * I)) * (L - x)**3 - (w * L**3) / (6 * E1 * I)
+    # theta1 does not depend on T, so any value will do
+    theta1_E1 = _distributed_load_parts(x, I, L, L, w)[1]
+    return theta1_E1 / E1
 
 def theta2(x, E1, E2, I, L, T, w):
     """
     Angular deflection theta2(x) for T <= x <= L (Distributed Load)
+    x may be a scalar or a NumPy array.
+    """
+    _, _, _, _, theta2_E1, theta2_E2 = _distributed_load_parts(x, I, L, T, w)
+    return theta2_E1 / E1 + theta2_E2 / E2
+
+def x_grid(L, step):
+    """
+    Read-only array of x positions from 0 to L, spaced as close to step as possible.
+    Uses a whole number of intervals so the first sample is exactly 0 and the last exactly L;
+    np.arange(0, L + step, step) may stop short of L or overshoot it depending on float rounding.
+    """
+    # At least one interval, so a beam shorter than step/2 still ends at L
+    N = max(int(round(L / step)), 1) + 1
+    x_values = np.linspace(0.0, L, N)
+    x_values.setflags(write=False)
+    return x_values
+
+def distributed_load_basis(x_values, I, L, T, w):
+    """
+    Material-independent parts of the Distributed Load solution over the whole x_values array.
+    y1/y2/theta1/theta2 are linear in 1/E1 and 1/E2, so for any pair of materials
+        y(x) = y_E1 / E1 + y_E2 / E2
+        theta(x) = theta_E1 / E1 + theta_E2 / E2
+    Returns (y_E1, y_E2, theta_E1, theta_E2); these only need computing once per beam and load.
     """
-    term1 = (w / (6 * E2 * I)) * (L - x)**3
-    coefficient = (-w) / (6 * I) * ((L**3 - (L - T)**3)/E1 + (L - T)**3 / E2)
-    return term1 + coefficient
+    y1_E1, theta1_E1, y2_E1, y2_E2, theta2_E1, theta2_E2 = _distributed_load_parts(x_values, I, L, T, w)
+    # 0 <= x < T: only E1 contributes
+    mask = x_values < T
+    return (np.where(mask, y1_E1, y2_E1), np.where(mask, 0.0, y2_E2),
+            np.where(mask, theta1_E1, theta2_E1), np.where(mask, 0.0, theta2_E2))
 
-def y_point_load(x, P, E1, I, y):
+def point_load_curves(x_values, P, E1, I, y):
     """
-    Deflection equation y(x) for Point Load
+    Deflection y(x) and angular deflection theta(x) for Point Load over the whole x_values array.
+    The x < y test and the powers of x are evaluated once and shared by both equations.
+    """
+    before_load = x_values < y
+    x2 = x_values * x_values
+    x3 = x2 * x_values
+    y_values = np.where(before_load,
+                        (P / (2 * E1 * I)) * (y * x2 - x3 / 3),
+                        (P * y**2) / (2 * E1 * I) * (x_values - y))
+    theta_values = np.where(before_load,
+                            - (P / (E1 * I)) * (y * x_values - x2 / 2),
+                            - (P * y**2) / (2 * E1 * I))
+    return y_values, theta_values
+
+def write_rows(writer, prefixes, x_rounded, y_values, theta_values):
+    """
+    Write one block of results to the CSV writer once for every prefix in prefixes.
+    Each prefix holds the leading Beam/Load/Material1/Material2 columns shared by every row;
+    passing several lets identical results (e.g. point loads, which do not depend on E2)
+    be formatted once and written for each material pair.
+    x_rounded is the x grid already rounded to 4 decimals.
+    """
+    # Convert theta from radians to degrees and round for better readability
+    theta_degrees = np.round(theta_values * _RAD2DEG, 6)
+    values = list(zip(x_rounded, y_values.tolist(), theta_degrees.tolist()))
+    for prefix in prefixes:
+        writer.writerows([*prefix, *row] for row in values)
+
+def _writer_worker(blocks, writer, errors):
+    """
+    Background CSV writer. Takes (prefixes, x_rounded, y_values, theta_values) items from the
+    blocks queue and passes them to write_rows until it receives None.
+    If a write fails the exception is stored in errors and the remaining items are
+    drained without writing, so the producer never blocks on a full queue.
+    """
+    while True:
+        item = blocks.get()
+        try:
+            if item is None:
+                return
+            if not errors:
+                write_rows(writer, *item)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            blocks.task_done()
+
+def depends_on_E2(load_type, L, T, w):
+    """
+    Whether the results for a beam and load depend on the second material at all.
+    Point loads only use E1, and a distributed load never reaches the second material
+    when T >= L or has no effect when w == 0; those cases only need one result per E1.
+    """
+    return load_type == "distributed" and T < L and w != 0
+
+def _combo_iter(materials, per_pair):
     """
-    if x < y:
-        return (P / (2 * E1 * I)) * (y * x**2 - (x**3) / 3)
+    Yields (row, material1, materials2) for every result row of compute_configuration.
+    With per_pair each row is one (E1, E2) pair and materials2 holds just that E2;
+    otherwise each row is one E1 and materials2 holds every material, so the
+    E2-independent result is written once for each pair.
+    """
+    if per_pair:
+        for row, (material1, material2) in enumerate(itertools.product(materials, repeat=2)):
+            yield row, material1, [material2]
     else:
-        return (P * y**2) / (2 * E1 * I) * (x - y)
+        for row, material1 in enumerate(materials):
+            yield row, material1, materials
 
-def theta_point_load(x, P, E1, I, y):
+def compute_configuration(load_type, x_values, L, I, T, w, P, y_load, moduli):
     """
-    Angular deflection theta(x) for Point Load
+    Computes deflection and angular deflection for one beam and load over every pair of materials.
+    Runs in a worker process, so it only takes and returns plain numbers and arrays.
+    Returns (y, theta). When the results depend on E2 (see depends_on_E2) they have one row
+    per (E1, E2) pair, in itertools.product(moduli, repeat=2) order; otherwise they only
+    have one row per E1, in moduli order.
     """
-    if x < y:
-        return - (P / (E1 * I)) * (y * x - (x**2) / 2)
+    # Reciprocals once per material so the per-sample work is multiplies only
+    inverse_moduli = [1.0 / E for E in moduli]
+
+    if load_type == "distributed":
+        # Everything that does not depend on the materials is computed once
+        y_E1, y_E2, theta_E1, theta_E2 = distributed_load_basis(x_values, I, L, T, w)
+        if depends_on_E2(load_type, L, T, w):
+            material_inverses = itertools.product(inverse_moduli, repeat=2)
+            y = np.empty((len(moduli) ** 2, x_values.size))
+        else:
+            # The E2 parts are all zero, so only E1 matters
+            material_inverses = ((inv_E1, 0.0) for inv_E1 in inverse_moduli)
+            y = np.empty((len(moduli), x_values.size))
+        theta = np.empty_like(y)
+        for row, (inv_E1, inv_E2) in enumerate(material_inverses):
+            combine_block(y_E1, y_E2, theta_E1, theta_E2, inv_E1, inv_E2, y[row], theta[row])
     else:
-        return - (P * y**2) / (2 * E1 * I)
+        y = np.empty((len(moduli), x_values.size))
+        theta = np.empty_like(y)
+        # The point load solution is proportional to 1/E1: evaluate it once for E1 = 1 and scale
+        y_unit, theta_unit = point_load_curves(x_values, P, 1.0, I, y_load)
+        for row, inv_E1 in enumerate(inverse_moduli):
+            np.multiply(y_unit, inv_E1, out=y[row])
+            np.multiply(theta_unit, inv_E1, out=theta[row])
+
+    return y, theta
 
-def compute_deflections(library: BeamLibrary, output_filename: str = "deflection_results.csv"):
+def _collect_transition_points(library: BeamLibrary):
     """
-    Computes deflection and angular deflection results for all unique combinations of materials and loads,
-    and writes the results to a CSV file.
-    Returns a dictionary of transition points for each beam.
+    Asks for the Transition Point T of every beam and load combination that will be computed.
+    Only reads input; no deflections are computed here.
+    Returns a dictionary mapping (beam name, load name) to T. Loads that are skipped
+    (point loads outside the beam, unsupported load types) have no entry.
     """
     materials = library.get_materials()
     beams = library.get_beams()
@@ -72,132 +231,181 @@ def compute_deflections(library: BeamLibrary, output_filename: str = "deflection
     print(f"Loaded {len(beams)} beams.")
     print(f"Loaded {len(loads)} loads.")
 
-    if not beams:
-        print("No beams defined in the library. Exiting deflection computation.")
+    if not (beams and loads and materials):
+        print("The library needs at least one beam, load, and material. Exiting deflection computation.")
         return {}
 
-    if not loads:
-        print("No loads defined in the library. Exiting deflection computation.")
-        return {}
+    # Dictionary to store transition points
+    transition_points = {}
 
-    if not materials:
-        print("No materials defined in the library. Exiting deflection computation.")
-        return {}
+    # Iterate over all combinations of beams and loads, asking for the Transition Points
+    for beam in beams:
+        L = beam.length
+
+        print(f"\n--- Configuring Beam: {beam.name} ---")
+
+        for load in loads:
+            print(f"\nApplying Load: {load.name} (Type: {load.load_type.capitalize()})")
+
+            # Determine if the load is distributed or point
+            if load.load_type == "distributed":
+                # Prompt user for Transition Point T for this beam
+                while True:
+                    try:
+                        T_input = input(f"Enter the Transition Point T [m] for Beam '{beam.name}' (0 < T < {L}): ").strip()
+                        T = float(T_input)
+                        if 0 < T < L:
+                            # For distributed loads, no additional checks
+                            transition_points[(beam.name, load.name)] = T
+                            break
+                        else:
+                            print(f"Transition Point T must be between 0 and {L} meters.")
+                    except ValueError:
+                        print("Invalid input. Please enter a numerical value for T.")
+
+            elif load.load_type == "point":
+                y_load = load.a
+
+                # Ensure the point load position is within the beam
+                if not (0 < y_load < L):
+                    print(f"Warning: Point load position a = {y_load} m is outside the beam length ({L} m). Skipping this load.")
+                    continue
+
+                # Prompt user for Transition Point T for this beam
+                while True:
+                    try:
+                        T_input = input(f"Enter the Transition Point T [m] for Beam '{beam.name}' (must be after point load position y = {y_load} m, and 0 < T < {L}): ").strip()
+                        T = float(T_input)
+                        if 0 < T < L:
+                            if T < y_load:
+                                print(f"Warning: Transition Point T = {T} m is before the point load position y = {y_load} m. Results may not be representative.")
+                            # Store the transition point
+                            transition_points[(beam.name, load.name)] = T
+                            break
+                        else:
+                            print(f"Transition Point T must be between 0 and {L} meters.")
+                    except ValueError:
+                        print("Invalid input. Please enter a numerical value for T.")
+            else:
+                print(f"Unsupported load type: {load.load_type}. Skipping this load.")
+
+    return transition_points
+
+def _run_computation(library: BeamLibrary, transition_points: dict, output_filename: str = "deflection_results.csv",
+                     max_workers: Optional[int] = None):
+    """
+    Computes deflection and angular deflection results for every beam and load in transition_points
+    over all combinations of materials, and writes the results to a CSV file.
+    Never asks for input: each beam and load is computed in a separate worker process
+    (at most max_workers at a time).
+    """
+    materials = library.get_materials()
 
     # Define x range with increments of 0.0025m
     step = 0.0025
 
-    # Prepare CSV file
-    with open(output_filename, mode='w', newline='') as file:
+    # (beam, load, T, x_values, x_rounded) for every configuration to compute, in output order
+    configurations = []
+    for beam in library.get_beams():
+        # Define x values from 0 to L with step 0.0025m, shared by every load on this beam
+        x_values = x_grid(beam.length, step)
+        # x column of the CSV, rounded for better readability
+        x_rounded = np.round(x_values, 4).tolist()
+        for load in library.get_loads():
+            T = transition_points.get((beam.name, load.name))
+            if T is not None:
+                configurations.append((beam, load, T, x_values, x_rounded))
+
+    moduli = [material.E for material in materials]
+
+    # Prepare CSV file, with a 1 MiB buffer since the output can run to millions of rows
+    with open(output_filename, mode='w', newline='', buffering=1 << 20) as file:
         writer = csv.writer(file)
         # Write header
         writer.writerow(['Beam', 'Load', 'Material1', 'Material2', 'x (m)', 'y(x) (m)', 'theta(x) (degrees)'])
 
-        # Dictionary to store transition points
-        transition_points = {}
-
-        # Iterate over all combinations of beams, loads, materials (E1 and E2)
-        for beam in beams:
-            I = beam.moment_of_inertia()
-            L = beam.length
-
-            print(f"\n--- Configuring Beam: {beam.name} ---")
-
-            for load in loads:
-                print(f"\nApplying Load: {load.name} (Type: {load.load_type.capitalize()})")
-
-                # Determine if the load is distributed or point
-                if load.load_type == "distributed":
-                    w = load.w
-                    # Prompt user for Transition Point T for this beam
-                    while True:
-                        try:
-                            T_input = input(f"Enter the Transition Point T [m] for Beam '{beam.name}' (0 < T < {L}): ").strip()
-                            T = float(T_input)
-                            if 0 < T < L:
-                                # For distributed loads, no additional checks
-                                transition_points.setdefault(beam.name, []).append(T)
-                                break
-                            else:
-                                print(f"Transition Point T must be between 0 and {L} meters.")
-                        except ValueError:
-                            print("Invalid input. Please enter a numerical value for T.")
-
-                    # Iterate over all combinations of E1 and E2
-                    for material1, material2 in itertools.product(materials, repeat=2):
-                        E1 = material1.E
-                        E2 = material2.E
-
-                        # Define x values from 0 to L with step 0.0025m
-                        x_values = np.arange(0, L + step, step)
-
-                        for x in x_values:
-                            if x < T:
-                                y = y1(x, E1, I, L, w)
-                                theta = theta1(x, E1, I, L, w)
-                            else:
-                                y = y2(x, E1, E2, I, L, T, w)
-                                theta = theta2(x, E1, E2, I, L, T, w)
-                            # Convert theta from radians to degrees
-                            theta_degrees = np.degrees(theta)
-                            # Round x, y, and theta for better readability
-                            writer.writerow([beam.name, load.name, material1.name, material2.name,
-                                             round(x, 4), y, round(theta_degrees, 6)])
-
-                elif load.load_type == "point":
-                    P = load.P
-                    y_load = load.a
-
-                    # Ensure the point load position is within the beam
-                    if not (0 < y_load < L):
-                        print(f"Warning: Point load position a = {y_load} m is outside the beam length ({L} m). Skipping this load.")
-                        continue
-
-                    # Prompt user for Transition Point T for this beam
-                    while True:
-                        try:
-                            T_input = input(f"Enter the Transition Point T [m] for Beam '{beam.name}' (must be after point load position y = {y_load} m, and 0 < T < {L}): ").strip()
-                            T = float(T_input)
-                            if 0 < T < L:
-                                if T < y_load:
-                                    print(f"Warning: Transition Point T = {T} m is before the point load position y = {y_load} m. Results may not be representative.")
-                                # Store the transition point
-                                transition_points.setdefault(beam.name, []).append(T)
-                                break
-                            else:
-                                print(f"Transition Point T must be between 0 and {L} meters.")
-                        except ValueError:
-                            print("Invalid input. Please enter a numerical value for T.")
-
-                    # Iterate over all combinations of E1 and E2
-                    for material1, material2 in itertools.product(materials, repeat=2):
-                        E1 = material1.E
-                        E2 = material2.E  # Note: For point loads, E2 might not be used unless modeling multiple materials beyond T
-
-                        # Define x values from 0 to L with step 0.0025m
-                        x_values = np.arange(0, L + step, step)
-
-                        for x in x_values:
-                            if x < y_load:
-                                y = y_point_load(x, P, E1, I, y_load)
-                                theta = theta_point_load(x, P, E1, I, y_load)
-                            else:
-                                y = y_point_load(x, P, E1, I, y_load)  # Deflection is continuous across y_load
-                                theta = theta_point_load(x, P, E1, I, y_load)
-                            # Convert theta from radians to degrees
-                            theta_degrees = np.degrees(theta)
-                            # Round x, y, and theta for better readability
-                            writer.writerow([beam.name, load.name, material1.name, material2.name,
-                                             round(x, 4), y, round(theta_degrees, 6)])
-                else:
-                    print(f"Unsupported load type: {load.load_type}. Skipping this load.")
+        # Formatting and writing happen on a background thread so they overlap with the computation
+        blocks = queue.Queue(maxsize=8)
+        write_errors = []
+        writer_thread = threading.Thread(target=_writer_worker, args=(blocks, writer, write_errors), daemon=True)
+        # Only a few configurations are in flight at a time, so finished results cannot pile up
+        # in memory faster than the writer gets through them
+        window = 2 * (max_workers or os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            def submit(configuration):
+                beam, load, T, x_values, _ = configuration
+                return configuration, executor.submit(compute_configuration, load.load_type, x_values, beam.length,
+                                                      beam.moment_of_inertia(), T, load.w, load.P, load.a, moduli)
+
+            remaining = iter(configurations)
+            pending = deque(submit(configuration) for configuration in itertools.islice(remaining, window))
+
+            # Only started once the first work is submitted, so the pool never forks a multi-threaded process
+            writer_thread.start()
+            try:
+                # Queue results in configuration order as they become available
+                while pending:
+                    (beam, load, T, _, x_rounded), future = pending.popleft()
+                    y, theta = future.result()
+                    next_configuration = next(remaining, None)
+                    if next_configuration is not None:
+                        pending.append(submit(next_configuration))
+                    # E2-independent results come back once per E1 and are repeated for every E2,
+                    # keeping one row set per material pair in the CSV
+                    per_pair = depends_on_E2(load.load_type, beam.length, T, load.w)
+                    for row, material1, materials2 in _combo_iter(materials, per_pair):
+                        prefixes = [[beam.name, load.name, material1.name, material2.name] for material2 in materials2]
+                        blocks.put((prefixes, x_rounded, y[row], theta[row]))
+            finally:
+                # Let the writer finish everything queued before the file is closed
+                blocks.put(None)
+                writer_thread.join()
+
+        if write_errors:
+            raise write_errors[0]
 
     print(f"\nDeflection and angular deflection results have been written to '{output_filename}'.")
+
+def compute_deflections(library: BeamLibrary, output_filename: str = "deflection_results.csv",
+                        max_workers: Optional[int] = None):
+    """
+    Computes deflection and angular deflection results for all unique combinations of materials and loads,
+    and writes the results to a CSV file.
+    All Transition Points are asked for first, then everything is computed in one go.
+    Returns a dictionary of transition points keyed by (beam name, load name).
+    """
+    transition_points = _collect_transition_points(library)
+    if transition_points:
+        _run_computation(library, transition_points, output_filename, max_workers)
     return transition_points
 
+def _plot_theta_curves(beam_name, load_name, x_values, labels, theta_matrix, colors):
+    """
+    Draws one angular deflection figure for a beam and load.
+    theta_matrix holds theta(x) in degrees with one column per material combination;
+    all columns are drawn with a single plot call and then given the matching label and color.
+    """
+    # Prepare the plot
+    fig, ax = plt.subplots(figsize=(14, 8))
+    ax.set_title(f"Angular Deflection Curves for Beam: {beam_name} with Load: {load_name}")
+    ax.set_xlabel("Position along beam x (m)")
+    ax.set_ylabel("Angular Deflection θ(x) (degrees)")
+    ax.grid(True)
+
+    lines = ax.plot(x_values, theta_matrix)
+    for line, label, color in zip(lines, labels, colors):
+        line.set_label(label)
+        line.set_color(color)
+
+    # Add legend outside the plot area for clarity
+    ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left', fontsize='small')
+    fig.tight_layout()
+    plt.show()
+
 def plot_deflections(library: BeamLibrary, transition_points: dict):
     """
-    Generates deflection curve plots for each beam.
+    Generates deflection curve plots for each beam and every load with a Transition Point
+    in transition_points (keyed by (beam name, load name)).
     Each plot contains separate curves for each unique material combination.
     The y-axis represents angular deflection theta(x) in degrees.
     """
@@ -205,130 +413,62 @@ def plot_deflections(library: BeamLibrary, transition_points: dict):
     beams = library.get_beams()
     loads = library.get_loads()
 
-    if not beams:
-        print("No beams defined in the library. Exiting plot generation.")
+    if not (beams and loads and materials):
+        print("The library needs at least one beam, load, and material. Exiting plot generation.")
         return
 
-    if not loads:
-        print("No loads defined in the library. Exiting plot generation.")
-        return
+    # Define x range with increments of 0.0025m
+    step = 0.0025
 
-    if not materials:
-        print("No materials defined in the library. Exiting plot generation.")
-        return
+    # Generate a unique color for each material combination
+    num_combinations = len(materials) ** 2
+    # Using 'viridis' for a large number of colors; one (num_combinations, 4) RGBA lookup
+    colors = plt.get_cmap('viridis')(np.linspace(0.0, 1.0, num_combinations))
+
+    # Labels and moduli for every combination of E1 and E2, in plotting order
+    material_pairs = list(itertools.product(materials, repeat=2))
+    labels = [f"{material1.name} & {material2.name}" for material1, material2 in material_pairs]
+    inv_E1_values = 1.0 / np.array([material1.E for material1, _ in material_pairs])
+    inv_E2_values = 1.0 / np.array([material2.E for _, material2 in material_pairs])
 
     # Iterate over each beam
     for beam in beams:
         I = beam.moment_of_inertia()
         L = beam.length
+        # Define x values from 0 to L with step 0.0025m, shared by every load on this beam
+        x_values = x_grid(L, step)
 
         print(f"\n--- Plotting Angular Deflection for Beam: {beam.name} ---")
 
-        # Retrieve stored Transition Points T
-        Ts = transition_points.get(beam.name, [])
-
         # Iterate over each load applied to this beam
         for load in loads:
-            if load.load_type == "distributed":
-                if not Ts:
-                    print(f"No Transition Point T found for Beam '{beam.name}' and Load '{load.name}'. Skipping plot for this load.")
-                    continue
-                T = Ts.pop(0)  # Assuming one T per load per beam
+            # Retrieve stored Transition Point T
+            T = transition_points.get((beam.name, load.name))
+            if T is None:
+                print(f"No Transition Point T found for Beam '{beam.name}' and Load '{load.name}'. Skipping plot for this load.")
+                continue
 
+            if load.load_type == "distributed":
                 w = load.w
                 print(f"Plotting for Distributed Load '{load.name}' with T = {T} m")
 
-                # Prepare the plot
-                plt.figure(figsize=(14, 8))
-                plt.title(f"Angular Deflection Curves for Beam: {beam.name} with Load: {load.name}")
-                plt.xlabel("Position along beam x (m)")
-                plt.ylabel("Angular Deflection θ(x) (degrees)")
-                plt.grid(True)
-
-                # Generate a unique color for each material combination
-                num_combinations = len(materials) ** 2
-                color_cycle = plt.get_cmap('viridis')  # Using 'viridis' for a large number of colors
-                colors = [color_cycle(i / num_combinations) for i in range(num_combinations)]
+                _, _, theta_E1, theta_E2 = distributed_load_basis(x_values, I, L, T, w)
 
-                color_idx = 0  # Index to keep track of colors
-
-                # Iterate over all combinations of E1 and E2
-                for material1, material2 in itertools.product(materials, repeat=2):
-                    E1 = material1.E
-                    E2 = material2.E
-
-                    # Define x values from 0 to L with step 0.0025m
-                    x_values = np.arange(0, L + 0.0025, 0.0025)
-                    theta_values = []
-
-                    for x in x_values:
-                        if x < T:
-                            theta = theta1(x, E1, I, L, w)
-                        else:
-                            theta = theta2(x, E1, E2, I, L, T, w)
-                        theta_degrees = np.degrees(theta)
-                        theta_values.append(theta_degrees)
-
-                    # Label for the curve
-                    label = f"{material1.name} & {material2.name}"
-                    # Plot the curve
-                    plt.plot(x_values, theta_values, label=label, color=colors[color_idx])
-                    color_idx += 1
-
-                # Add legend outside the plot area for clarity
-                plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left', fontsize='small')
-                plt.tight_layout()
-                plt.show()
+                # One column for each combination of E1 and E2
+                theta_matrix = (theta_E1[:, None] * inv_E1_values + theta_E2[:, None] * inv_E2_values) * _RAD2DEG
+                _plot_theta_curves(beam.name, load.name, x_values, labels, theta_matrix, colors)
 
             elif load.load_type == "point":
-                if not Ts:
-                    print(f"No Transition Point T found for Beam '{beam.name}' and Load '{load.name}'. Skipping plot for this load.")
-                    continue
-                T = Ts.pop(0)  # Assuming one T per load per beam
-
                 P = load.P
                 y_load = load.a
 
                 print(f"Plotting for Point Load '{load.name}' with T = {T} m and y = {y_load} m")
 
-                # Prepare the plot
-                plt.figure(figsize=(14, 8))
-                plt.title(f"Angular Deflection Curves for Beam: {beam.name} with Load: {load.name}")
-                plt.xlabel("Position along beam x (m)")
-                plt.ylabel("Angular Deflection θ(x) (degrees)")
-                plt.grid(True)
-
-                # Generate a unique color for each material combination
-                num_combinations = len(materials) ** 2
-                color_cycle = plt.get_cmap('viridis')  # Using 'viridis' for a large number of colors
-                colors = [color_cycle(i / num_combinations) for i in range(num_combinations)]
-
-                color_idx = 0  # Index to keep track of colors
-
-                # Iterate over all combinations of E1 and E2
-                for material1, material2 in itertools.product(materials, repeat=2):
-                    E1 = material1.E
-                    E2 = material2.E  # Note: For point loads, E2 might not be used unless modeling multiple materials beyond T
-
-                    # Define x values from 0 to L with step 0.0025m
-                    x_values = np.arange(0, L + 0.0025, 0.0025)
-                    theta_values = []
-
-                    for x in x_values:
-                        theta = theta_point_load(x, P, E1, I, y_load)
-                        theta_degrees = np.degrees(theta)
-                        theta_values.append(theta_degrees)
-
-                    # Label for the curve
-                    label = f"{material1.name} & {material2.name}"
-                    # Plot the curve
-                    plt.plot(x_values, theta_values, label=label, color=colors[color_idx])
-                    color_idx += 1
-
-                # Add legend outside the plot area for clarity
-                plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left', fontsize='small')
-                plt.tight_layout()
-                plt.show()
+                # One column for each combination of E1 and E2
+                # Note: For point loads, E2 might not be used unless modeling multiple materials beyond T
+                _, theta_unit = point_load_curves(x_values, P, 1.0, I, y_load)
+                theta_matrix = theta_unit[:, None] * inv_E1_values * _RAD2DEG
+                _plot_theta_curves(beam.name, load.name, x_values, labels, theta_matrix, colors)
             else:
                 print(f"Unsupported load type: {load.load_type}. Skipping plot for this load.")
 
@@ -336,13 +476,16 @@ def main():
     # Initialize the library
     library = BeamLibrary()
 
-    # Compute deflections and write to CSV, capturing transition points
-    transition_points = compute_deflections(library, output_filename="deflection_results.csv")
+    # Ask for all transition points up front
+    transition_points = _collect_transition_points(library)
 
     if not transition_points:
         print("No deflection computations were performed.")
         return
 
+    # Compute deflections and write to CSV
+    _run_computation(library, transition_points, output_filename="deflection_results.csv")
+
     # Generate angular deflection plots using transition points
     plot_deflections(library, transition_points)
 